@@ -2,6 +2,11 @@
 
 from ._keccak import keccak
 from ._rpc import (
+    EXECUTION_ERROR_CODE,
+    INVALID_PARAMETER_CODE,
+    INVALID_REQUEST_CODE,
+    METHOD_NOT_FOUND_CODE,
+    SERVER_ERROR_CODE,
     Block,
     BlockHash,
     BlockInfo,
@@ -12,6 +17,7 @@ from ._rpc import (
     EthCallParams,
     FilterParams,
     FilterParamsEIP234,
+    LogEntriesSoA,
     LogEntry,
     LogsBloom,
     LogTopic,
@@ -27,6 +33,7 @@ from ._rpc import (
 from ._serialization import (
     JSON,
     structure,
+    structure_logs,
     unstructure,
 )
 from ._typed_wrappers import Address, Amount
@@ -43,11 +50,17 @@ __all__ = [
     "EthCallParams",
     "FilterParams",
     "FilterParamsEIP234",
+    "LogEntriesSoA",
     "LogEntry",
     "LogsBloom",
     "LogTopic",
     "RPCError",
     "RPCErrorCode",
+    "SERVER_ERROR_CODE",
+    "INVALID_REQUEST_CODE",
+    "METHOD_NOT_FOUND_CODE",
+    "INVALID_PARAMETER_CODE",
+    "EXECUTION_ERROR_CODE",
     "TrieHash",
     "TxHash",
     "TxInfo",
@@ -56,6 +69,7 @@ __all__ = [
     "UnclesHash",
     "JSON",
     "structure",
+    "structure_logs",
     "unstructure",
     "Address",
     "Amount",
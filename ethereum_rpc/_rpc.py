@@ -1,8 +1,10 @@
 """Ethereum RPC schema."""
 
+from array import array
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
-from enum import Enum
-from typing import NewType
+from enum import Enum, IntEnum
+from typing import NewType, overload
 
 from ._typed_wrappers import Address, Amount, TypedData
 
@@ -10,53 +12,53 @@ from ._typed_wrappers import Address, Amount, TypedData
 class LogTopic(TypedData):
     """Log topic (32 bytes)."""
 
-    def _length(self) -> int:
-        return 32
+    __slots__ = ()
+    _LENGTH = 32
 
 
 class BlockHash(TypedData):
     """Block hash (32 bytes)."""
 
-    def _length(self) -> int:
-        return 32
+    __slots__ = ()
+    _LENGTH = 32
 
 
 class TxHash(TypedData):
     """Transaction hash (32 bytes)."""
 
-    def _length(self) -> int:
-        return 32
+    __slots__ = ()
+    _LENGTH = 32
 
 
 class TrieHash(TypedData):
     """Trie hash (32 bytes)."""
 
-    def _length(self) -> int:
-        return 32
+    __slots__ = ()
+    _LENGTH = 32
 
 
 class UnclesHash(TypedData):
     """Hash of block uncles (32 bytes)."""
 
-    def _length(self) -> int:
-        return 32
+    __slots__ = ()
+    _LENGTH = 32
 
 
 class BlockNonce(TypedData):
     """Block nonce (8 bytes)."""
 
-    def _length(self) -> int:
-        return 8
+    __slots__ = ()
+    _LENGTH = 8
 
 
 class LogsBloom(TypedData):
     """Bloom filter for logs (256 bytes)."""
 
-    def _length(self) -> int:
-        return 256
+    __slots__ = ()
+    _LENGTH = 256
 
 
-class BlockLabel(Enum):
+class BlockLabel(str, Enum):
     """Block label."""
 
     LATEST = "latest"
@@ -79,7 +81,7 @@ Block = int | BlockLabel
 """Possible values of the block parameter in RPC calls."""
 
 
-@dataclass
+@dataclass(slots=True)
 class TxInfo:
     """Transaction info."""
 
@@ -144,7 +146,7 @@ class TxInfo:
     """ECDSA signature s."""
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     """Log entry metadata."""
 
@@ -188,7 +190,133 @@ class LogEntry:
     """The block number where this log was."""
 
 
-@dataclass
+def _index_array(values: Iterable[int]) -> "array[int]":
+    try:
+        return array("Q", values)
+    except OverflowError as exc:
+        raise ValueError("Log indices and block numbers must fit into 64 bits") from exc
+
+
+@dataclass(slots=True)
+class LogEntriesSoA:
+    """
+    A sequence of log entries stored column-wise, one list per :py:class:`LogEntry` field.
+    Can be used instead of ``tuple[LogEntry, ...]`` when a large number of logs
+    is processed one field at a time.
+
+    The integer fields are stored as contiguous arrays of unsigned 64-bit integers.
+    """
+
+    removed: list[bool]
+    """``removed`` values of the log entries."""
+
+    address: list[Address]
+    """``address`` values of the log entries."""
+
+    data: list[bytes]
+    """``data`` values of the log entries."""
+
+    topics: list[tuple[LogTopic, ...]]
+    """``topics`` values of the log entries."""
+
+    log_index: "array[int]"
+    """``log_index`` values of the log entries."""
+
+    transaction_index: "array[int]"
+    """``transaction_index`` values of the log entries."""
+
+    transaction_hash: list[TxHash]
+    """``transaction_hash`` values of the log entries."""
+
+    block_hash: list[BlockHash]
+    """``block_hash`` values of the log entries."""
+
+    block_number: "array[int]"
+    """``block_number`` values of the log entries."""
+
+    def __post_init__(self) -> None:
+        lengths = {
+            len(self.removed),
+            len(self.address),
+            len(self.data),
+            len(self.topics),
+            len(self.log_index),
+            len(self.transaction_index),
+            len(self.transaction_hash),
+            len(self.block_hash),
+            len(self.block_number),
+        }
+        if len(lengths) != 1:
+            raise ValueError("All the columns must have the same length")
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[LogEntry]) -> "LogEntriesSoA":
+        """
+        Creates the column-wise representation of the given log entries.
+        Raises ``ValueError`` if any of the log indices, transaction indices
+        or block numbers does not fit into 64 bits.
+        """
+        entries = tuple(entries)
+        return cls(
+            removed=[entry.removed for entry in entries],
+            address=[entry.address for entry in entries],
+            data=[entry.data for entry in entries],
+            topics=[entry.topics for entry in entries],
+            log_index=_index_array(entry.log_index for entry in entries),
+            transaction_index=_index_array(entry.transaction_index for entry in entries),
+            transaction_hash=[entry.transaction_hash for entry in entries],
+            block_hash=[entry.block_hash for entry in entries],
+            block_number=_index_array(entry.block_number for entry in entries),
+        )
+
+    def __len__(self) -> int:
+        """Returns the number of log entries."""
+        return len(self.removed)
+
+    @overload
+    def __getitem__(self, index: int) -> LogEntry: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "LogEntriesSoA": ...
+
+    def __getitem__(self, index: int | slice) -> "LogEntry | LogEntriesSoA":
+        """
+        Returns the log entry at the given position,
+        or a :py:class:`LogEntriesSoA` with the given range of entries if ``index`` is a slice.
+        """
+        if isinstance(index, slice):
+            return LogEntriesSoA(
+                removed=self.removed[index],
+                address=self.address[index],
+                data=self.data[index],
+                topics=self.topics[index],
+                log_index=self.log_index[index],
+                transaction_index=self.transaction_index[index],
+                transaction_hash=self.transaction_hash[index],
+                block_hash=self.block_hash[index],
+                block_number=self.block_number[index],
+            )
+        if not isinstance(index, int):
+            raise TypeError(f"Indices must be integers or slices, got {type(index).__name__}")
+        return LogEntry(
+            removed=self.removed[index],
+            address=self.address[index],
+            data=self.data[index],
+            topics=self.topics[index],
+            log_index=self.log_index[index],
+            transaction_index=self.transaction_index[index],
+            transaction_hash=self.transaction_hash[index],
+            block_hash=self.block_hash[index],
+            block_number=self.block_number[index],
+        )
+
+    def __iter__(self) -> Iterator[LogEntry]:
+        """Iterates over the log entries."""
+        for index in range(len(self)):
+            yield self[index]
+
+
+@dataclass(slots=True)
 class TxReceipt:
     """Transaction receipt."""
 
@@ -247,7 +375,7 @@ class TxReceipt:
         return self.status == 1
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockInfo:
     """Block info."""
 
@@ -315,27 +443,51 @@ class BlockInfo:
     """The "extra data" field of this block."""
 
 
-class RPCErrorCode(Enum):
-    """Known RPC error codes returned by providers."""
+# Need a newtype because unlike all other integers, this one is not hexified on serialization.
+ErrorCode = NewType("ErrorCode", int)
+
+
+SERVER_ERROR_CODE = ErrorCode(-32000)
+"""Reserved for implementation-defined server-errors. See the message for details."""
+
+INVALID_REQUEST_CODE = ErrorCode(-32600)
+"""The JSON sent is not a valid Request object."""
+
+METHOD_NOT_FOUND_CODE = ErrorCode(-32601)
+"""The method does not exist / is not available."""
+
+INVALID_PARAMETER_CODE = ErrorCode(-32602)
+"""Invalid method parameter(s)."""
+
+EXECUTION_ERROR_CODE = ErrorCode(3)
+"""Contract transaction failed during execution. See the data for details."""
+
 
-    SERVER_ERROR = -32000
+class RPCErrorCode(IntEnum):
+    """
+    Known RPC error codes returned by providers.
+    Since it is an ``IntEnum``, the entries can be compared with :py:attr:`RPCError.code` directly,
+    but in performance-sensitive code it is cheaper to compare with the plain integer constants
+    (e.g. :py:data:`EXECUTION_ERROR_CODE`).
+    """
+
+    SERVER_ERROR = SERVER_ERROR_CODE
     """Reserved for implementation-defined server-errors. See the message for details."""
 
-    INVALID_REQUEST = -32600
+    INVALID_REQUEST = INVALID_REQUEST_CODE
     """The JSON sent is not a valid Request object."""
 
-    METHOD_NOT_FOUND = -32601
+    METHOD_NOT_FOUND = METHOD_NOT_FOUND_CODE
     """The method does not exist / is not available."""
 
-    INVALID_PARAMETER = -32602
+    INVALID_PARAMETER = INVALID_PARAMETER_CODE
     """Invalid method parameter(s)."""
 
-    EXECUTION_ERROR = 3
+    EXECUTION_ERROR = EXECUTION_ERROR_CODE
     """Contract transaction failed during execution. See the data for details."""
 
 
-# Need a newtype because unlike all other integers, this one is not hexified on serialization.
-ErrorCode = NewType("ErrorCode", int)
+_RPC_ERROR_CODE_MAP: dict[int, RPCErrorCode] = {code.value: code for code in RPCErrorCode}
 
 
 @dataclass
@@ -357,10 +509,7 @@ class RPCError(Exception):
     @property
     def parsed_code(self) -> None | RPCErrorCode:
         """If the error code is known, returns the corresponding enum entry."""
-        try:
-            return RPCErrorCode(self.code)
-        except ValueError:
-            return None
+        return _RPC_ERROR_CODE_MAP.get(self.code)
 
     def __str__(self) -> str:
         return f"RPC error {self.code}: {self.message}" + (f" ({self.data!r})" if self.data else "")
@@ -371,7 +520,7 @@ class RPCError(Exception):
         return cls(ErrorCode(code.value), message, data=data)
 
 
-@dataclass
+@dataclass(slots=True)
 class Type2Transaction:
     """An EIP-1559 (dynamic fee) transaction."""
 
@@ -401,7 +550,7 @@ class Type2Transaction:
     """The associated data of the transaction."""
 
 
-@dataclass
+@dataclass(slots=True)
 class EthCallParams:
     """Transaction fields for ``eth_call``."""
 
@@ -430,7 +579,7 @@ class EthCallParams:
     """The associated data of the transaction."""
 
 
-@dataclass
+@dataclass(slots=True)
 class EstimateGasParams:
     """Transaction fields for ``eth_estimateGas``."""
 
@@ -456,7 +605,7 @@ class EstimateGasParams:
     """The associated data of the transaction."""
 
 
-@dataclass
+@dataclass(slots=True)
 class FilterParams:
     """Filter parameters for ``eth_getLogs`` or ``eth_newFilter``."""
 
@@ -473,7 +622,7 @@ class FilterParams:
     """Log topics."""
 
 
-@dataclass
+@dataclass(slots=True)
 class FilterParamsEIP234:
     """Alternative filter parameters for ``eth_getLogs`` (introduced in EIP-234)."""
 
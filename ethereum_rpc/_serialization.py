@@ -1,15 +1,21 @@
 """Ethereum RPC schema."""
 
-from collections.abc import Generator, Mapping, Sequence
+import sys
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import MISSING, fields, is_dataclass
+from functools import cache
+from itertools import chain, repeat
 from types import MappingProxyType, NoneType, UnionType
-from typing import Any, TypeVar, Union, cast
+from typing import Any, NewType, TypeVar, Union, cast, get_args, get_origin
 
 from compages import (
-    StructureDictIntoDataclass,
+    SequentialStructureHandler,
+    SequentialUnstructureHandler,
     Structurer,
     StructuringError,
     UnstructureDataclassToDict,
     Unstructurer,
+    UnstructuringError,
     simple_structure,
     simple_typechecked_unstructure,
     structure_into_bool,
@@ -27,8 +33,19 @@ from compages import (
     unstructure_as_tuple,
     unstructure_as_union,
 )
-
-from ._rpc import BlockLabel, ErrorCode, Type2Transaction
+from compages.path import PathElem, StructField
+
+from ._rpc import (
+    BlockHash,
+    BlockLabel,
+    ErrorCode,
+    LogEntriesSoA,
+    LogEntry,
+    LogTopic,
+    TxHash,
+    Type2Transaction,
+    _index_array,
+)
 from ._typed_wrappers import Address, TypedData, TypedQuantity
 
 JSON = None | bool | int | float | str | Sequence["JSON"] | Mapping[str, "JSON"]
@@ -36,7 +53,12 @@ JSON = None | bool | int | float | str | Sequence["JSON"] | Mapping[str, "JSON"]
 
 
 def _structure_into_bytes(_structurer: Structurer, _structure_into: Any, val: Any) -> bytes:
-    if not isinstance(val, str) or not val.startswith("0x"):
+    # Values are almost always strings, so it's faster to ask for forgiveness here.
+    try:
+        has_prefix = val.startswith("0x")
+    except (AttributeError, TypeError):
+        has_prefix = False
+    if not has_prefix:
         raise StructuringError("The value must be a 0x-prefixed hex-encoded data")
     try:
         return bytes.fromhex(val[2:])
@@ -52,6 +74,107 @@ def _structure_into_block_label(val: Any) -> BlockLabel:
         raise StructuringError(str(exc)) from exc
 
 
+def _check_hex_prefixes(vals: list[Any]) -> list[str]:
+    # `startswith()` raises `AttributeError` or `TypeError` for non-strings.
+    if not all(val.startswith("0x") for val in vals):
+        raise ValueError("The value must be 0x-prefixed")
+    return [val[2:] for val in vals]
+
+
+def _decode_hex_data(vals: list[Any]) -> list[bytes]:
+    return list(map(bytes.fromhex, _check_hex_prefixes(vals)))
+
+
+def _decode_hex_ints(vals: list[Any]) -> list[int]:
+    _check_hex_prefixes(vals)
+    return list(map(int, vals, repeat(16)))
+
+
+def _decode_log_columns(val: Any) -> tuple[list[Any], ...]:
+    """
+    Decodes a list of JSON log entries into lists of values of each :py:class:`LogEntry` field
+    (in the order of definition), processing all the values of a field at once.
+
+    Raises ``AttributeError``, ``KeyError``, ``TypeError`` or ``ValueError``
+    if anything is wrong with the input; it is up to the caller to produce a readable error.
+    """
+    if not isinstance(val, list | tuple):
+        raise TypeError("The value must be a list")
+    # The regular dataclass structuring only accepts dicts, not arbitrary mappings
+    if any(not isinstance(entry, dict) for entry in val):
+        raise TypeError("The value must be a dict")
+
+    removed = [entry["removed"] for entry in val]
+    if any(type(flag) is not bool for flag in removed):
+        raise TypeError("The value must be a boolean")
+
+    entry_topics = [entry["topics"] for entry in val]
+    if any(not isinstance(topics, list | tuple) for topics in entry_topics):
+        raise TypeError("The value must be a list")
+    all_topics = list(map(LogTopic, _decode_hex_data(list(chain.from_iterable(entry_topics)))))
+    topics = []
+    position = 0
+    for entry in entry_topics:
+        topics.append(tuple(all_topics[position : position + len(entry)]))
+        position += len(entry)
+
+    return (
+        removed,
+        list(map(Address, _decode_hex_data([entry["address"] for entry in val]))),
+        _decode_hex_data([entry["data"] for entry in val]),
+        topics,
+        _decode_hex_ints([entry["logIndex"] for entry in val]),
+        _decode_hex_ints([entry["transactionIndex"] for entry in val]),
+        list(map(TxHash, _decode_hex_data([entry["transactionHash"] for entry in val]))),
+        list(map(BlockHash, _decode_hex_data([entry["blockHash"] for entry in val]))),
+        _decode_hex_ints([entry["blockNumber"] for entry in val]),
+    )
+
+
+# Any problem with the input raises one of these in `_decode_log_columns()`.
+_DECODE_LOG_COLUMNS_ERRORS = (AttributeError, KeyError, TypeError, ValueError)
+
+
+def _structure_into_log_entries_soa(
+    structurer: Structurer, structure_into: type[LogEntriesSoA], val: Any
+) -> LogEntriesSoA:
+    try:
+        columns = _decode_log_columns(val)
+    except _DECODE_LOG_COLUMNS_ERRORS:
+        # Let the regular structuring fail and report where the problem is.
+        entries = structurer.structure_into(tuple[LogEntry, ...], val)
+        try:
+            return structure_into.from_entries(entries)
+        except ValueError as exc:
+            raise StructuringError(str(exc)) from exc
+
+    (
+        removed,
+        address,
+        data,
+        topics,
+        log_index,
+        transaction_index,
+        transaction_hash,
+        block_hash,
+        block_number,
+    ) = columns
+    try:
+        return structure_into(
+            removed=removed,
+            address=address,
+            data=data,
+            topics=topics,
+            log_index=_index_array(log_index),
+            transaction_index=_index_array(transaction_index),
+            transaction_hash=transaction_hash,
+            block_hash=block_hash,
+            block_number=_index_array(block_number),
+        )
+    except ValueError as exc:
+        raise StructuringError(str(exc)) from exc
+
+
 def _structure_into_typed_data(
     _structurer: Structurer, structure_into: type[TypedData], val: Any
 ) -> TypedData:
@@ -59,19 +182,22 @@ def _structure_into_typed_data(
     return structure_into(data)
 
 
+def _structure_into_int_common(val: Any) -> int:
+    # Values are almost always strings, so it's faster to ask for forgiveness here.
+    try:
+        if val.startswith("0x"):
+            return int(val, 16)
+    except (AttributeError, TypeError):
+        pass
+    except ValueError as exc:
+        raise StructuringError(str(exc)) from exc
+    raise StructuringError("The value must be a 0x-prefixed hex-encoded integer")
+
+
 def _structure_into_typed_quantity(
     _structurer: Structurer, structure_into: type[TypedQuantity], val: Any
 ) -> TypedQuantity:
-    if not isinstance(val, str) or not val.startswith("0x"):
-        raise StructuringError("The value must be a 0x-prefixed hex-encoded integer")
-    int_val = int(val, 0)
-    return structure_into(int_val)
-
-
-def _structure_into_int_common(val: Any) -> int:
-    if not isinstance(val, str) or not val.startswith("0x"):
-        raise StructuringError("The value must be a 0x-prefixed hex-encoded integer")
-    return int(val, 0)
+    return structure_into(_structure_into_int_common(val))
 
 
 @simple_structure
@@ -79,12 +205,12 @@ def _structure_into_int(val: Any) -> int:
     return _structure_into_int_common(val)
 
 
-def _unstructure_type2tx(
-    unstructurer: Unstructurer, _unstructure_as: type[Type2Transaction], obj: Type2Transaction
-) -> Generator[Type2Transaction, dict[str, JSON], JSON]:
-    json = yield obj
-    json["type"] = unstructurer.unstructure_as(int, 2)
-    return json
+def _unstructure_log_entries_soa(
+    unstructurer: Unstructurer, _unstructure_as: type[LogEntriesSoA], obj: LogEntriesSoA
+) -> JSON:
+    if not isinstance(obj, LogEntriesSoA):
+        raise UnstructuringError("The value must be of type `LogEntriesSoA`")
+    return cast(JSON, unstructurer.unstructure_as(tuple[LogEntry, ...], tuple(obj)))
 
 
 @simple_typechecked_unstructure
@@ -94,7 +220,7 @@ def _unstructure_typed_quantity(obj: TypedQuantity) -> str:
 
 @simple_typechecked_unstructure
 def _unstructure_typed_data(obj: TypedData) -> str:
-    return "0x" + bytes(obj).hex()
+    return obj.hex()
 
 
 @simple_typechecked_unstructure
@@ -104,6 +230,9 @@ def _unstructure_address(obj: Address) -> str:
 
 @simple_typechecked_unstructure
 def _unstructure_block_label(obj: BlockLabel) -> str:
+    # `BlockLabel` is a `str` subclass, but for a plain `(str, Enum)` mix-in
+    # both `str()` and `format()` give `"BlockLabel.LATEST"`,
+    # and the JSON output needs an exact `str` with the label itself.
     return obj.value
 
 
@@ -117,19 +246,133 @@ def _unstructure_bytes_to_hex(obj: bytes) -> str:
     return "0x" + obj.hex()
 
 
-def _to_camel_case(name: str, _metadata: MappingProxyType[Any, Any]) -> str:
+@cache
+def _to_camel_case_cached(name: str) -> str:
     if name.endswith("_"):
         name = name[:-1]
     parts = name.split("_")
-    return parts[0] + "".join(part.capitalize() for part in parts[1:])
+    # Identifier-like string literals are interned by Python, so interning the result
+    # lets dictionary lookups against such keys succeed on the identity check.
+    return sys.intern(parts[0] + "".join(part.capitalize() for part in parts[1:]))
+
+
+def _to_camel_case(name: str, _metadata: MappingProxyType[Any, Any]) -> str:
+    # The metadata is not hashable, and we don't use it anyway,
+    # so the caching is done on the name only.
+    return _to_camel_case_cached(name)
 
 
-STRUCTURER = Structurer(
+class _StructureDictIntoDataclass(SequentialStructureHandler):
+    """
+    Same as :py:class:`compages.StructureDictIntoDataclass`, but the field names, types
+    and defaults are collected and converted only once per dataclass.
+    """
+
+    def __init__(self, name_converter: Callable[[str, MappingProxyType[Any, Any]], str]):
+        self._name_converter = name_converter
+        self._field_tables: dict[Any, list[tuple[str, str, Any, Any]]] = {}
+
+    def _field_table(self, structure_into: Any) -> list[tuple[str, str, Any, Any]]:
+        table = self._field_tables.get(structure_into)
+        if table is None:
+            table = [
+                (
+                    field.name,
+                    self._name_converter(field.name, field.metadata),
+                    field.type,
+                    field.default,
+                )
+                for field in fields(structure_into)
+            ]
+            self._field_tables[structure_into] = table
+        return table
+
+    def applies(self, structure_into: Any, val: Any) -> bool:
+        return is_dataclass(structure_into) and isinstance(val, dict)
+
+    def __call__(self, structurer: Structurer, structure_into: Any, val: Any) -> Any:
+        results = {}
+        exceptions: list[tuple[PathElem, StructuringError]] = []
+        for name, val_name, field_type, default in self._field_table(structure_into):
+            if val_name in val:
+                try:
+                    results[name] = structurer.structure_into(field_type, val[val_name])
+                except StructuringError as exc:
+                    exceptions.append((StructField(name), exc))
+            elif default is not MISSING:
+                results[name] = default
+            else:
+                if val_name == name:
+                    message = "Missing field"
+                else:
+                    message = f"Missing field (`{val_name}` in the input)"
+                exceptions.append((StructField(name), StructuringError(message)))
+
+        if exceptions:
+            raise StructuringError(
+                f"Cannot structure a dict into a dataclass {structure_into}", exceptions
+            )
+
+        return structure_into(**results)
+
+
+def _get_lookup_order(tp: Any) -> list[Any]:
+    # Same as the handler lookup order used by `compages.Structurer`.
+    if isinstance(tp, NewType):
+        return [tp, *_get_lookup_order(tp.__supertype__)]
+    origin = get_origin(tp)
+    if origin is not None:
+        return [tp, *_get_lookup_order(origin)]
+    if hasattr(tp, "mro"):
+        return cast(list[Any], tp.mro()[:-1])
+    return [tp]
+
+
+class _Structurer(Structurer):
+    """
+    A structurer that resolves the lookup handler for each type only once,
+    and on subsequent calls invokes it directly.
+
+    Relies on none of the lookup handlers being generators
+    (which would need the generic continuation machinery of :py:class:`compages.Structurer`).
+    """
+
+    def __init__(
+        self,
+        lookup_handlers: Mapping[Any, Callable[[Structurer, Any, Any], Any]],
+        sequential_handlers: Iterable[SequentialStructureHandler],
+    ):
+        super().__init__(lookup_handlers, sequential_handlers)
+        self._handlers: dict[Any, Callable[[Structurer, Any, Any], Any]] = dict(lookup_handlers)
+        self._resolved_handlers: dict[Any, None | Callable[[Structurer, Any, Any], Any]] = {}
+
+    def _resolve_handler(self, structure_into: Any) -> None | Callable[[Structurer, Any, Any], Any]:
+        for tp in _get_lookup_order(structure_into):
+            handler = self._handlers.get(tp)
+            if handler is not None:
+                return handler
+        return None
+
+    def structure_into(self, structure_into: Any, val: Any) -> Any:
+        try:
+            handler = self._resolved_handlers[structure_into]
+        except KeyError:
+            handler = self._resolve_handler(structure_into)
+            self._resolved_handlers[structure_into] = handler
+
+        if handler is None:
+            # Dataclasses are handled by sequential handlers which depend on the value.
+            return super().structure_into(structure_into, val)
+        return handler(self, structure_into, val)
+
+
+STRUCTURER: Structurer = _Structurer(
     {
         TypedData: _structure_into_typed_data,
         TypedQuantity: _structure_into_typed_quantity,
         ErrorCode: structure_into_int,
         BlockLabel: _structure_into_block_label,
+        LogEntriesSoA: _structure_into_log_entries_soa,
         int: _structure_into_int,
         str: structure_into_str,
         bool: structure_into_bool,
@@ -140,9 +383,143 @@ STRUCTURER = Structurer(
         Union: structure_into_union,
         NoneType: structure_into_none,
     },
-    [StructureDictIntoDataclass(_to_camel_case)],
+    [_StructureDictIntoDataclass(_to_camel_case)],
 )
 
+
+def _is_default(value: Any, default: Any) -> bool:
+    # On the off-chance the comparison is strict and raises an exception on type mismatch
+    # (same as in `compages.UnstructureDataclassToDict`).
+    try:
+        return bool(value == default)
+    except Exception:  # noqa: BLE001
+        return False
+
+
+def _inline_unstructure(tp: Any, fallback: str, namespace: dict[str, Any]) -> str:
+    """
+    Returns an expression unstructuring ``value`` of type ``tp`` the same way ``UNSTRUCTURER``
+    would do it. The types that do not have a specialized expression,
+    or values of unexpected types, are handled by evaluating the ``fallback`` expression.
+    """
+    if get_origin(tp) in (UnionType, Union):
+        args = get_args(tp)
+        if len(args) == 2 and NoneType in args:
+            (inner_tp,) = (arg for arg in args if arg is not NoneType)
+            inner = _inline_unstructure(inner_tp, fallback, namespace)
+            return f"None if value is None else ({inner})"
+        return fallback
+
+    # Note that in Python 3.10 generic aliases pass the `isinstance(..., type)` check.
+    if get_origin(tp) is not None or not isinstance(tp, type):
+        return fallback
+
+    tp_name = f"tp_{len(namespace)}"
+    namespace[tp_name] = tp
+    if tp is int:
+        expr = "hex(value)"
+    elif tp is bytes:
+        expr = '"0x" + value.hex()'
+    elif tp in (bool, str):
+        expr = "value"
+    elif issubclass(tp, Address):
+        expr = "value.checksum"
+    elif issubclass(tp, TypedData):
+        expr = "value.hex()"
+    elif issubclass(tp, TypedQuantity):
+        expr = "hex(int(value))"
+    else:
+        return fallback
+
+    return f"{expr} if type(value) is {tp_name} else {fallback}"
+
+
+def _generate_unstructure_dataclass(
+    unstructure_as: Any, name_converter: Callable[[str, MappingProxyType[Any, Any]], str]
+) -> Callable[[Unstructurer, Any], dict[str, JSON]]:
+    """
+    Generates a function unstructuring an instance of the dataclass ``unstructure_as``
+    without going through the unstructurer for the fields of simple types.
+    """
+    namespace: dict[str, Any] = {"_is_default": _is_default}
+    lines = ["def unstructure(unstructurer, obj):", "    result = {}"]
+    for index, field in enumerate(fields(unstructure_as)):
+        result_name = name_converter(field.name, field.metadata)
+        field_tp_name = f"field_tp_{index}"
+        namespace[field_tp_name] = field.type
+        fallback = f"unstructurer.unstructure_as({field_tp_name}, value)"
+        expr = _inline_unstructure(field.type, fallback, namespace)
+
+        lines.append(f"    value = obj.{field.name}")
+        # If the value field is equal to the default one, don't add it to the result.
+        if field.default is MISSING:
+            indent = "    "
+        elif field.default is None:
+            lines.append("    if value is not None:")
+            indent = "        "
+        else:
+            default_name = f"default_{index}"
+            namespace[default_name] = field.default
+            lines.append(f"    if not _is_default(value, {default_name}):")
+            indent = "        "
+        lines.append(f"{indent}result[{result_name!r}] = {expr}")
+    lines.append("    return result")
+
+    source = "\n".join(lines)
+    filename = f"<unstructure {unstructure_as.__module__}.{unstructure_as.__qualname__}>"
+    exec(compile(source, filename, "exec"), namespace)  # noqa: S102
+    return cast(Callable[[Unstructurer, Any], dict[str, JSON]], namespace["unstructure"])
+
+
+class _UnstructureDataclassToDict(SequentialUnstructureHandler):
+    """
+    Same as :py:class:`compages.UnstructureDataclassToDict`, but uses a specialized function
+    generated for each dataclass on first use.
+    """
+
+    def __init__(self, name_converter: Callable[[str, MappingProxyType[Any, Any]], str]):
+        self._name_converter = name_converter
+        self._generic_handler = UnstructureDataclassToDict(name_converter)
+        self._functions: dict[Any, Callable[[Unstructurer, Any], dict[str, JSON]]] = {}
+
+    def applies(self, unstructure_as: Any, val: Any) -> bool:
+        return (
+            isinstance(unstructure_as, type)
+            and is_dataclass(unstructure_as)
+            and isinstance(val, unstructure_as)
+        )
+
+    def __call__(self, unstructurer: Unstructurer, unstructure_as: Any, val: Any) -> Any:
+        func = self._functions.get(unstructure_as)
+        if func is None:
+            func = _generate_unstructure_dataclass(unstructure_as, self._name_converter)
+            self._functions[unstructure_as] = func
+        try:
+            return func(unstructurer, val)
+        except UnstructuringError:
+            # The generic handler will fail too, but it will attach the failing field paths.
+            return self._generic_handler(unstructurer, unstructure_as, val)
+
+
+_UNSTRUCTURE_DATACLASS_TO_DICT = _UnstructureDataclassToDict(_to_camel_case)
+
+
+# The transaction type tag is a constant, no need to go through the unstructurer for every call.
+_TYPE2_TX_TAG = hex(2)
+
+
+def _unstructure_type2tx(
+    unstructurer: Unstructurer, unstructure_as: type[Type2Transaction], obj: Type2Transaction
+) -> JSON:
+    # Calling the dataclass handler directly instead of yielding to it from a generator
+    # saves the overhead of suspending and resuming the handler.
+    if not isinstance(obj, unstructure_as):
+        raise UnstructuringError(f"The value must be of type `{unstructure_as.__name__}`")
+    json = _UNSTRUCTURE_DATACLASS_TO_DICT(unstructurer, unstructure_as, obj)
+    json["type"] = _TYPE2_TX_TAG
+    return cast(JSON, json)
+
+
 UNSTRUCTURER = Unstructurer(
     {
         TypedData: _unstructure_typed_data,
@@ -151,6 +528,7 @@ UNSTRUCTURER = Unstructurer(
         BlockLabel: _unstructure_block_label,
         ErrorCode: unstructure_as_int,
         Type2Transaction: _unstructure_type2tx,
+        LogEntriesSoA: _unstructure_log_entries_soa,
         int: _unstructure_int_to_hex,
         bytes: _unstructure_bytes_to_hex,
         bool: unstructure_as_bool,
@@ -161,7 +539,7 @@ UNSTRUCTURER = Unstructurer(
         Union: unstructure_as_union,
         tuple: unstructure_as_tuple,
     },
-    [UnstructureDataclassToDict(_to_camel_case)],
+    [_UNSTRUCTURE_DATACLASS_TO_DICT],
 )
 
 
@@ -176,6 +554,21 @@ def structure(structure_into: type[_T], obj: JSON) -> _T:
     return STRUCTURER.structure_into(structure_into, obj)
 
 
+def structure_logs(obj: JSON) -> tuple[LogEntry, ...]:
+    """
+    Structures a list of JSON log entries (e.g. returned by ``eth_getLogs``).
+    Same as ``structure(tuple[LogEntry, ...], obj)``, but decodes the values of each field
+    for all the entries at once, which is faster for a large number of entries.
+    Raises :py:class:`compages.StructuringError` on failure.
+    """
+    try:
+        columns = _decode_log_columns(obj)
+    except _DECODE_LOG_COLUMNS_ERRORS:
+        # Let the regular structuring fail and report where the problem is.
+        return structure(tuple[LogEntry, ...], obj)
+    return tuple(map(LogEntry, *columns))
+
+
 def unstructure(obj: Any, unstructure_as: Any = None) -> JSON:
     """
     Unstructures a given Ethereum RPC entity into a JSON-serializable value.
@@ -1,6 +1,5 @@
-from abc import ABC, abstractmethod
 from functools import cached_property
-from typing import Any, TypeVar, cast
+from typing import Any, ClassVar, TypeVar, cast
 
 from ._keccak import keccak
 
@@ -10,22 +9,23 @@ TypedDataLike = TypeVar("TypedDataLike", bound="TypedData")
 TypedQuantityLike = TypeVar("TypedQuantityLike", bound="TypedQuantity")
 
 
-class TypedData(ABC):
+class TypedData:
+    __slots__ = ("_value",)
+
+    _LENGTH: ClassVar[int]
+    """The length of this type's values representation in bytes."""
+
     def __init__(self, value: bytes):
         self._value = value
         if not isinstance(value, bytes):
             raise TypeError(
                 f"{self.__class__.__name__} must be a bytestring, got {type(value).__name__}"
             )
-        if len(value) != self._length():
+        if len(value) != self._LENGTH:
             raise ValueError(
-                f"{self.__class__.__name__} must be {self._length()} bytes long, got {len(value)}"
+                f"{self.__class__.__name__} must be {self._LENGTH} bytes long, got {len(value)}"
             )
 
-    @abstractmethod
-    def _length(self) -> int:
-        """Returns the length of this type's values representation in bytes."""
-
     def __bytes__(self) -> bytes:
         return self._value
 
@@ -161,8 +161,7 @@ class Address(TypedData):
     so objects of different types cannot be compared to each other.
     """
 
-    def _length(self) -> int:
-        return 20
+    _LENGTH = 20
 
     @classmethod
     def from_hex(cls: type[CustomAddress], address_str: str) -> CustomAddress:
@@ -1,9 +1,19 @@
 import os
+import pickle
+from copy import copy, deepcopy
+from dataclasses import replace
+from types import MappingProxyType
+
+import pytest
+from compages import StructuringError
 
 from ethereum_rpc import (
+    EXECUTION_ERROR_CODE,
     BlockHash,
     BlockInfo,
     BlockNonce,
+    LogEntriesSoA,
+    LogEntry,
     LogsBloom,
     LogTopic,
     RPCError,
@@ -14,6 +24,8 @@ from ethereum_rpc import (
     TxReceipt,
     UnclesHash,
     structure,
+    structure_logs,
+    unstructure,
 )
 
 EXAMPLE_BLOCK_NO_TX = {
@@ -188,15 +200,21 @@ EXAMPLE_TX_RECEIPT = {
 
 def test_typed_data_lengths():
     # Just try to create the corresponding types,
-    # it will cover their respective length methods.
+    # it will check their respective lengths.
     # Everything else is in the base class which is tested elsewhere
-    TxHash(os.urandom(32))
-    BlockHash(os.urandom(32))
-    LogTopic(os.urandom(32))
-    TrieHash(os.urandom(32))
-    UnclesHash(os.urandom(32))
-    BlockNonce(os.urandom(8))
-    LogsBloom(os.urandom(256))
+    values = [
+        TxHash(os.urandom(32)),
+        BlockHash(os.urandom(32)),
+        LogTopic(os.urandom(32)),
+        TrieHash(os.urandom(32)),
+        UnclesHash(os.urandom(32)),
+        BlockNonce(os.urandom(8)),
+        LogsBloom(os.urandom(256)),
+    ]
+
+    # These are created in large numbers, check that they are slotted
+    for value in values:
+        assert not hasattr(value, "__dict__")
 
 
 def test_block_info():
@@ -206,11 +224,87 @@ def test_block_info():
     block = structure(BlockInfo, EXAMPLE_BLOCK_WITH_TX)
     assert isinstance(block.transactions[0], TxInfo)
 
+    assert structure(BlockInfo, unstructure(block)) == block
+
 
 def test_tx_receipt():
     tx = structure(TxReceipt, EXAMPLE_TX_RECEIPT)
     assert tx.succeeded
 
+    assert structure(TxReceipt, unstructure(tx)) == tx
+
+
+def test_log_entries_soa():
+    logs = EXAMPLE_TX_RECEIPT["logs"]
+    entries = structure(tuple[LogEntry, ...], logs)
+
+    soa = structure(LogEntriesSoA, logs)
+    assert soa == LogEntriesSoA.from_entries(entries)
+    assert len(soa) == len(entries)
+    assert soa[0] == entries[0]
+    assert tuple(soa) == entries
+
+    # Slicing returns the same container
+    sliced = soa[0:1]
+    assert isinstance(sliced, LogEntriesSoA)
+    assert tuple(sliced) == entries[0:1]
+    assert soa[1:] == LogEntriesSoA.from_entries(entries[1:])
+
+    with pytest.raises(TypeError, match="Indices must be integers or slices, got str"):
+        soa["0"]
+
+    with pytest.raises(ValueError, match="All the columns must have the same length"):
+        replace(soa, data=[*soa.data, b""])
+    assert list(soa.log_index) == [entry.log_index for entry in entries]
+    assert soa.log_index.typecode == "Q"
+
+    # The integer columns are 64-bit
+    logs = deepcopy(logs)
+    logs[0]["blockNumber"] = hex(2**64)
+    with pytest.raises(StructuringError, match="must fit into 64 bits"):
+        structure(LogEntriesSoA, logs)
+
+    big_entry = replace(entries[0], block_number=2**64)
+    with pytest.raises(ValueError, match="must fit into 64 bits"):
+        LogEntriesSoA.from_entries([big_entry])
+
+    assert unstructure(soa) == unstructure(entries, tuple[LogEntry, ...])
+
+
+def test_structure_logs():
+    logs = EXAMPLE_TX_RECEIPT["logs"]
+    assert structure_logs(logs) == structure(tuple[LogEntry, ...], logs)
+    assert structure_logs([]) == ()
+
+    # Only dicts are accepted as entries, same as in the regular structuring
+    proxies = [MappingProxyType(entry) for entry in logs]
+    for structure_into in [tuple[LogEntry, ...], LogEntriesSoA]:
+        with pytest.raises(StructuringError, match="No handlers registered"):
+            structure(structure_into, proxies)
+    with pytest.raises(StructuringError, match="No handlers registered"):
+        structure_logs(proxies)
+
+    # Unprefixed `str` subclass values are rejected, same as in the regular structuring
+    class MyStr(str):
+        __slots__ = ()
+
+    bad_logs = deepcopy(logs)
+    bad_logs[0]["data"] = MyStr("abcd")
+    message = r"\[0\]\.data: The value must be a 0x-prefixed hex-encoded data"
+    with pytest.raises(StructuringError, match=message):
+        structure_logs(bad_logs)
+    with pytest.raises(StructuringError, match=message):
+        structure(LogEntriesSoA, bad_logs)
+
+    # Errors are reported the same way as in the regular structuring
+    logs = deepcopy(logs)
+    logs[0]["logIndex"] = 0x28
+    message = r"\[0\]\.log_index: The value must be a 0x-prefixed hex-encoded integer"
+    with pytest.raises(StructuringError, match=message):
+        structure_logs(logs)
+    with pytest.raises(StructuringError, match=message):
+        structure(LogEntriesSoA, logs)
+
 
 def test_rpc_error():
     error = RPCError(123, "message")
@@ -218,4 +312,15 @@ def test_rpc_error():
 
     error = RPCError.with_code(RPCErrorCode.INVALID_REQUEST, "message")
     assert error.parsed_code == RPCErrorCode.INVALID_REQUEST
+    assert error.code == RPCErrorCode.INVALID_REQUEST
     assert str(error) == "RPC error -32600: message"
+
+    # Keyword-only fields survive copying and pickling
+    error = RPCError.with_code(RPCErrorCode.EXECUTION_ERROR, "message", data=b"\xde\xad")
+    assert copy(error).data == b"\xde\xad"
+    assert pickle.loads(pickle.dumps(error)).data == b"\xde\xad"  # noqa: S301
+
+    error = structure(RPCError, {"code": 3, "message": "message"})
+    assert error.code == RPCErrorCode.EXECUTION_ERROR
+    assert error.code == EXECUTION_ERROR_CODE
+    assert error.parsed_code == RPCErrorCode.EXECUTION_ERROR
@@ -1,9 +1,20 @@
 import os
 
 import pytest
-from compages import StructuringError
+from compages import StructuringError, UnstructuringError
 
-from ethereum_rpc import Address, Amount, structure
+from ethereum_rpc import (
+    Address,
+    Amount,
+    BlockLabel,
+    EstimateGasParams,
+    EthCallParams,
+    FilterParams,
+    LogTopic,
+    Type2Transaction,
+    structure,
+    unstructure,
+)
 
 
 def test_structure_into_typed_quantity():
@@ -18,10 +29,14 @@ def test_structure_into_typed_quantity():
 def test_structure_into_int():
     assert structure(int, "0x123") == 0x123
 
-    with pytest.raises(
-        StructuringError, match="The value must be a 0x-prefixed hex-encoded integer"
-    ):
-        structure(int, "abc")
+    for val in ["abc", 123, b"0x123"]:
+        with pytest.raises(
+            StructuringError, match="The value must be a 0x-prefixed hex-encoded integer"
+        ):
+            structure(int, val)
+
+    with pytest.raises(StructuringError, match="invalid literal for int"):
+        structure(int, "0xzz")
 
 
 def test_structure_into_typed_data():
@@ -31,8 +46,100 @@ def test_structure_into_typed_data():
     with pytest.raises(StructuringError, match="The value must be a 0x-prefixed hex-encoded data"):
         structure(Address, "abc")
 
+    # `str` subclasses are checked for the prefix too
+    class MyStr(str):
+        __slots__ = ()
+
+    topic = os.urandom(32)
+    assert structure(LogTopic, MyStr("0x" + topic.hex())) == LogTopic(topic)
+    with pytest.raises(StructuringError, match="The value must be a 0x-prefixed hex-encoded data"):
+        structure(LogTopic, MyStr(topic.hex()))
+
     # The error text is weird
     with pytest.raises(
         StructuringError, match=r"non-hexadecimal number found in fromhex\(\) arg at position 0"
     ):
         structure(Address, "0xzz")
+
+
+def test_structure_into_bytes():
+    data = os.urandom(16)
+    assert structure(bytes, "0x" + data.hex()) == data
+    assert structure(bytes, "0x") == b""
+
+    class MyStr(str):
+        __slots__ = ()
+
+    assert structure(bytes, MyStr("0x" + data.hex())) == data
+
+    for val in ["", data.hex(), 123, b"0x12", MyStr(data.hex())]:
+        with pytest.raises(
+            StructuringError, match="The value must be a 0x-prefixed hex-encoded data"
+        ):
+            structure(bytes, val)
+
+
+def test_structure_into_dataclass():
+    address = os.urandom(20)
+    params = structure(EstimateGasParams, {"from": "0x" + address.hex(), "gas": "0x10"})
+    assert params == EstimateGasParams(from_=Address(address), gas=0x10)
+
+    with pytest.raises(StructuringError, match=r"from_: Missing field \(`from` in the input\)"):
+        structure(EstimateGasParams, {"gas": "0x10"})
+
+    with pytest.raises(
+        StructuringError, match=r"gas\.<int>: The value must be a 0x-prefixed hex-encoded integer"
+    ):
+        structure(EstimateGasParams, {"from": "0x" + address.hex(), "gas": 16})
+
+
+def test_block_label():
+    params = structure(FilterParams, {"fromBlock": "latest", "toBlock": "0x10"})
+    assert params == FilterParams(from_block=BlockLabel.LATEST, to_block=0x10)
+    assert unstructure(params) == {"fromBlock": "latest", "toBlock": "0x10"}
+    assert type(unstructure(BlockLabel.SAFE)) is str
+
+    with pytest.raises(StructuringError, match="'pending!' is not a valid BlockLabel"):
+        structure(BlockLabel, "pending!")
+
+
+def test_unstructure_type2_transaction():
+    address = os.urandom(20)
+    tx = Type2Transaction(
+        chain_id=1,
+        value=Amount(10),
+        gas=21000,
+        max_fee_per_gas=Amount(5),
+        max_priority_fee_per_gas=Amount(1),
+        nonce=3,
+        to=Address(address),
+    )
+    assert unstructure(tx) == {
+        "chainId": "0x1",
+        "value": "0xa",
+        "gas": "0x5208",
+        "maxFeePerGas": "0x5",
+        "maxPriorityFeePerGas": "0x1",
+        "nonce": "0x3",
+        "to": Address(address).checksum,
+        "type": "0x2",
+    }
+
+    with pytest.raises(UnstructuringError, match="The value must be of type `Type2Transaction`"):
+        unstructure(address, Type2Transaction)
+
+
+def test_unstructure_dataclass():
+    address = os.urandom(20)
+
+    # Fields with default values are skipped
+    params = EthCallParams(to=Address(address), gas=0x10, data=b"\x01\x02")
+    assert unstructure(params) == {
+        "to": Address(address).checksum,
+        "gas": "0x10",
+        "data": "0x0102",
+    }
+
+    params = EthCallParams(to=Address(address), gas="0x10")
+    with pytest.raises(UnstructuringError, match=r"gas\.<int>: The value must be of type `int`"):
+        unstructure(params)